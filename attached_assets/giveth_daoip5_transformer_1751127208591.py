@@ -1,15 +1,112 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import re
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _dumps(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+# GraphQL selection sets, shared so projects and QF rounds can be requested in one document.
+# Only fields read by the transforms are selected to keep responses small.
+PROJECTS_SELECTION = """
+    allProjects(limit: $limit, skip: $skip) {
+        projects {
+            id
+            title
+            slug
+            description
+            image
+            creationDate
+            status {
+                name
+            }
+            addresses {
+                address
+                isRecipient
+            }
+            socialMedia {
+                type
+                link
+            }
+            donations {
+                valueUsd
+            }
+            qfRounds {
+                id
+                name
+                isActive
+            }
+        }
+        totalCount
+    }
+"""
+
+QF_ROUNDS_SELECTION = """
+    qfArchivedRounds {
+        qfRounds {
+            id
+            name
+            slug
+            description
+            isActive
+            endDate
+            allocatedFund
+        }
+        totalCount
+    }
+"""
+
+PROJECTS_QUERY = f"""
+query GetProjects($limit: Int, $skip: Int) {{
+{PROJECTS_SELECTION}
+}}
+"""
+
+PROJECTS_AND_QF_ROUNDS_QUERY = f"""
+query GetProjectsAndQFRounds($limit: Int, $skip: Int) {{
+{PROJECTS_SELECTION}
+{QF_ROUNDS_SELECTION}
+}}
+"""
+
+# UTC timestamps as returned by the Giveth API, e.g. 2024-01-02T03:04:05.123Z
+_ISO_DATE_PREFIX = re.compile(r'^\d{4}-\d{2}-\d{2}')
+_ISO_UTC_FAST = re.compile(r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d{3}|\d{6}))?Z$')
+
+# Social platforms accepted in DAOIP-5 applications, keyed by lowercased Giveth type
+_PLATFORM_MAP = {
+    "twitter": "Twitter",
+    "github": "GitHub",
+    "discord": "Discord",
+    "telegram": "Telegram",
+    "linkedin": "LinkedIn"
+}
+_ALLOWED_SOCIALS = frozenset({"Twitter", "Discord", "Telegram", "LinkedIn", "GitHub", "Farcaster", "Lens"})
+
+# Shared zero-amount funding entry; treat as read-only
+_USD_ZERO = [{"amount": "0", "denomination": "USD"}]
+
 @dataclass
 class GivethToDaoip5Config:
     """Configuration for the transformation process"""
@@ -17,6 +114,8 @@ class GivethToDaoip5Config:
     output_dir: str = "daoip5_output"
     base_uri: str = "https://giveth.io"
     chunk_size: int = 100  # For pagination
+    max_workers: int = 10  # Concurrent page requests
+    applications_jsonl: bool = False  # Also write applications.jsonl, one application per line
     
 class GivethDaoip5Transformer:
     def __init__(self, config: GivethToDaoip5Config):
@@ -24,9 +123,20 @@ class GivethDaoip5Transformer:
         self.session = requests.Session()
         self.session.headers.update({
             'Content-Type': 'application/json',
-            'User-Agent': 'DAOIP5-Transformer/1.0'
+            'User-Agent': 'DAOIP5-Transformer/1.0',
+            'Accept-Encoding': 'gzip, deflate'
         })
         
+        # Keep enough pooled connections for concurrent page fetches and retry transient gateway errors
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"POST"})  # GraphQL reads are safe to replay
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        
         # Create output directory
         os.makedirs(self.config.output_dir, exist_ok=True)
         
@@ -50,7 +160,7 @@ class GivethDaoip5Transformer:
         try:
             response = self.session.post(self.config.giveth_api_url, json=payload)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
             
             if "errors" in data:
                 logger.error(f"GraphQL errors: {data['errors']}")
@@ -63,125 +173,72 @@ class GivethDaoip5Transformer:
     
     def fetch_projects(self, limit: int = None) -> List[Dict]:
         """Fetch all projects from Giveth"""
-        query = """
-        query GetProjects($limit: Int, $skip: Int) {
-            allProjects(limit: $limit, skip: $skip) {
-                projects {
-                    id
-                    title
-                    slug
-                    description
-                    image
-                    creationDate
-                    updatedAt
-                    status {
-                        id
-                        name
-                        description
-                    }
-                    organization {
-                        id
-                        name
-                        website
-                        description
-                    }
-                    addresses {
-                        address
-                        chainType
-                        isRecipient
-                    }
-                    socialMedia {
-                        type
-                        link
-                    }
-                    categories {
-                        name
-                        mainCategory {
-                            title
-                        }
-                    }
-                    donations {
-                        id
-                        amount
-                        valueUsd
-                        currency
-                        transactionId
-                        transactionNetworkId
-                        createdAt
-                        anonymous
-                        user {
-                            id
-                            name
-                        }
-                    }
-                    qfRounds {
-                        id
-                        name
-                        isActive
-                        beginDate
-                        endDate
-                        allocatedFund
-                        roundUSDCapPerProject
-                        roundUSDCapPerUserPerProject
-                    }
-                }
-                totalCount
-            }
-        }
-        """
+        first_limit = min(self.config.chunk_size, limit) if limit else self.config.chunk_size
+        logger.info("Fetching projects batch 1")
+        data = self.execute_graphql_query(PROJECTS_QUERY, {"limit": first_limit, "skip": 0})
+        return self._collect_projects(data, first_limit, limit)
+    
+    def fetch_projects_and_qf_rounds(self, limit: int = None) -> Tuple[List[Dict], List[Dict]]:
+        """Fetch projects and QF rounds, batching the first projects page with the rounds query"""
+        first_limit = min(self.config.chunk_size, limit) if limit else self.config.chunk_size
+        logger.info("Fetching projects batch 1 with QF rounds")
+        data = self.execute_graphql_query(PROJECTS_AND_QF_ROUNDS_QUERY, {"limit": first_limit, "skip": 0})
+        
+        rounds = data.get("qfArchivedRounds", {}).get("qfRounds", [])
+        logger.info(f"Fetched {len(rounds)} QF rounds")
         
-        all_projects = []
-        skip = 0
+        projects = self._collect_projects(data, first_limit, limit)
+        return projects, rounds
+    
+    def _collect_projects(self, first_page: Dict, first_limit: int, limit: int = None) -> List[Dict]:
+        """Combine the first projects page with the remaining pages, fetched concurrently when totalCount is known"""
         batch_size = self.config.chunk_size
+        all_projects = first_page.get("allProjects", {}).get("projects", [])
+        self._enrich_projects(all_projects)
         
-        while True:
-            variables = {
-                "limit": min(batch_size, limit - len(all_projects)) if limit else batch_size,
-                "skip": skip
-            }
-            
-            logger.info(f"Fetching projects batch {skip // batch_size + 1}")
-            data = self.execute_graphql_query(query, variables)
-            
-            projects = data.get("allProjects", {}).get("projects", [])
-            if not projects:
-                break
-                
-            all_projects.extend(projects)
-            skip += len(projects)
-            
-            if limit and len(all_projects) >= limit:
-                all_projects = all_projects[:limit]
-                break
-                
-            # If we got fewer projects than requested, we're done
-            if len(projects) < batch_size:
-                break
+        if len(all_projects) < first_limit:
+            logger.info(f"Fetched {len(all_projects)} total projects")
+            return all_projects
+        
+        total_count = first_page.get("allProjects", {}).get("totalCount")
+        if not isinstance(total_count, int):
+            # Without totalCount the remaining pages can't be planned, so page until a short one
+            logger.warning("Projects response has no totalCount; fetching remaining pages sequentially")
+            while not limit or len(all_projects) < limit:
+                page_limit = min(batch_size, limit - len(all_projects)) if limit else batch_size
+                projects = self._fetch_projects_page(len(all_projects), page_limit)
+                all_projects.extend(projects)
+                if len(projects) < page_limit:
+                    break
+        else:
+            # The first page tells us totalCount, so the remaining pages can be requested concurrently
+            target = min(total_count, limit) if limit else total_count
+            skips = range(len(all_projects), target, batch_size)
+            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                pages = executor.map(
+                    lambda skip: self._fetch_projects_page(skip, min(batch_size, target - skip)),
+                    skips
+                )
+                for projects in pages:
+                    all_projects.extend(projects)
         
         logger.info(f"Fetched {len(all_projects)} total projects")
         return all_projects
     
+    def _fetch_projects_page(self, skip: int, limit: int) -> List[Dict]:
+        """Fetch a single page of projects"""
+        logger.info(f"Fetching projects batch {skip // self.config.chunk_size + 1}")
+        data = self.execute_graphql_query(PROJECTS_QUERY, {"limit": limit, "skip": skip})
+        projects = data.get("allProjects", {}).get("projects", [])
+        self._enrich_projects(projects)
+        return projects
+    
     def fetch_qf_rounds(self) -> List[Dict]:
         """Fetch QF rounds (grant pools)"""
-        query = """
-        query GetQFRounds {
-            qfArchivedRounds {
-                qfRounds {
-                    id
-                    name
-                    slug
-                    description
-                    isActive
-                    beginDate
-                    endDate
-                    allocatedFund
-                    roundUSDCapPerProject
-                    roundUSDCapPerUserPerProject
-                    network
-                }
-                totalCount
-            }
-        }
+        query = f"""
+        query GetQFRounds {{
+            {QF_ROUNDS_SELECTION}
+        }}
         """
         
         data = self.execute_graphql_query(query)
@@ -189,7 +246,9 @@ class GivethDaoip5Transformer:
         logger.info(f"Fetched {len(rounds)} QF rounds")
         return rounds
     
-    def transform_to_caip10(self, address: str, network: str = "1") -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def transform_to_caip10(address: str, network: str = "1") -> str:
         """Transform address to CAIP-10 format"""
         if not address:
             return ""
@@ -202,17 +261,57 @@ class GivethDaoip5Transformer:
         # Giveth primarily uses quadratic funding
         return "Quadratic Funding"
     
-    def format_iso_date(self, date_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def format_iso_date(date_str: str) -> str:
         """Format date string to ISO 8601"""
         if not date_str:
             return ""
+        # Anything that doesn't start with a date can't parse; skip the exception path
+        if not isinstance(date_str, str) or not _ISO_DATE_PREFIX.match(date_str):
+            return date_str
+        # Fast path for UTC timestamps: rewrite the string directly instead of round-tripping through datetime
+        match = _ISO_UTC_FAST.match(date_str)
+        if match:
+            base, fraction = match.groups()
+            if fraction and fraction.strip('0'):
+                return f"{base}.{fraction.ljust(6, '0')}+00:00"
+            return f"{base}+00:00"
         try:
             # Parse the date and ensure it's in ISO format
             dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
             return dt.isoformat()
-        except:
+        except (ValueError, TypeError):
             return date_str
     
+    def _enrich_projects(self, projects: List[Dict]):
+        """Cache per-project derived fields shared by the projects and applications transforms.
+        
+        Runs on each page as it arrives; raw donations are dropped once summed so
+        pages don't keep every donation record alive until the transforms finish.
+        """
+        for project in projects:
+            recipient_addr = next((addr for addr in project.get("addresses") or [] if addr.get("isRecipient")), None)
+            primary_address = (recipient_addr or {}).get("address", "")
+            project["_primary_address"] = primary_address
+            project["_project_id"] = self.transform_to_caip10(primary_address) if primary_address else f"giveth:project:{project['id']}"
+            project["_total_received_usd"] = sum(
+                float(donation["valueUsd"]) for donation in project.pop("donations", None) or [] if donation.get("valueUsd")
+            )
+            
+            # Socials in both the projects ({name, value}) and applications ({platform, url}) shapes
+            socials_short = []
+            socials_app = []
+            for social in project.get("socialMedia") or []:
+                social_type = social.get("type", "")
+                link = social.get("link", "")
+                socials_short.append({"name": social_type, "value": link})
+                platform = _PLATFORM_MAP.get(social_type.lower(), social_type)
+                if platform in _ALLOWED_SOCIALS:
+                    socials_app.append({"platform": platform, "url": link})
+            project["_socials_short"] = socials_short
+            project["_socials_app"] = socials_app
+    
     def transform_grant_system(self) -> Dict:
         """Transform Giveth to DAOIP-5 Grant System format"""
         return {
@@ -225,6 +324,9 @@ class GivethDaoip5Transformer:
     def transform_grant_pools(self, qf_rounds: List[Dict]) -> Dict:
         """Transform QF rounds to DAOIP-5 Grant Pools format"""
         grant_pools = []
+        applications_prefix = self.config.base_uri + "/applications/"
+        rounds_prefix = self.config.base_uri + "/rounds/"
+        image = self.config.base_uri + "/assets/giveth-logo.png"
         
         for round_data in qf_rounds:
             pool_id = self.transform_to_caip10(f"0x{round_data['id']}", "1")
@@ -237,8 +339,8 @@ class GivethDaoip5Transformer:
                 "grantFundingMechanism": self.map_funding_mechanism(round_data),
                 "isOpen": round_data.get("isActive", False),
                 "closeDate": self.format_iso_date(round_data.get("endDate", "")),
-                "applicationsURI": f"{self.config.base_uri}/applications/{round_data['id']}.json",
-                "governanceURI": f"{self.config.base_uri}/rounds/{round_data['slug']}",
+                "applicationsURI": applications_prefix + str(round_data['id']) + ".json",
+                "governanceURI": rounds_prefix + str(round_data['slug']),
                 "totalGrantPoolSize": [
                     {
                         "amount": str(round_data.get("allocatedFund", 0)),
@@ -246,7 +348,7 @@ class GivethDaoip5Transformer:
                     }
                 ],
                 "email": "info@giveth.io",
-                "image": f"{self.config.base_uri}/assets/giveth-logo.png"
+                "image": image
             }
             
             grant_pools.append(grant_pool)
@@ -263,23 +365,7 @@ class GivethDaoip5Transformer:
         transformed_projects = []
         
         for project in projects:
-            # Get primary address
-            primary_address = ""
-            if project.get("addresses"):
-                recipient_addr = next((addr for addr in project["addresses"] if addr.get("isRecipient")), None)
-                if recipient_addr:
-                    primary_address = recipient_addr.get("address", "")
-            
-            project_id = self.transform_to_caip10(primary_address) if primary_address else f"giveth:project:{project['id']}"
-            
-            # Transform social media
-            socials = []
-            if project.get("socialMedia"):
-                for social in project["socialMedia"]:
-                    socials.append({
-                        "name": social.get("type", ""),
-                        "value": social.get("link", "")
-                    })
+            project_id = project["_project_id"]
             
             transformed_project = {
                 "type": "Project",
@@ -294,7 +380,7 @@ class GivethDaoip5Transformer:
                 "image": project.get("image", ""),
                 "coverImage": project.get("image", ""),
                 "licenseURI": "",
-                "socials": socials
+                "socials": project["_socials_short"]
             }
             
             transformed_projects.append(transformed_project)
@@ -309,100 +395,80 @@ class GivethDaoip5Transformer:
     def transform_applications(self, projects: List[Dict], qf_rounds: List[Dict]) -> Dict:
         """Transform project-round relationships to DAOIP-5 Applications format"""
         applications_by_pool = {}
+        grant_pools_uri = f"{self.config.base_uri}/grant-pools.json"
+        projects_uri = f"{self.config.base_uri}/projects.json"
         
-        # Create a lookup for rounds
-        rounds_lookup = {round_data["id"]: round_data for round_data in qf_rounds}
+        # Optionally mirror each application to a JSONL sidecar as it is built
+        if self.config.applications_jsonl:
+            jsonl_context = open(os.path.join(self.config.output_dir, "applications.jsonl"), 'wb', buffering=1 << 20)
+        else:
+            jsonl_context = nullcontext()
         
-        for project in projects:
-            if not project.get("qfRounds"):
-                continue
-                
-            primary_address = ""
-            if project.get("addresses"):
-                recipient_addr = next((addr for addr in project["addresses"] if addr.get("isRecipient")), None)
-                if recipient_addr:
-                    primary_address = recipient_addr.get("address", "")
-            
-            project_id = self.transform_to_caip10(primary_address) if primary_address else f"giveth:project:{project['id']}"
-            
-            for qf_round in project["qfRounds"]:
-                round_id = qf_round["id"]
-                pool_id = self.transform_to_caip10(f"0x{round_id}", "1")
+        with jsonl_context as jsonl_file:
+            for project in projects:
+                if not project.get("qfRounds"):
+                    continue
+                    
+                primary_address = project["_primary_address"]
+                project_id = project["_project_id"]
                 
-                if pool_id not in applications_by_pool:
-                    applications_by_pool[pool_id] = {
-                        "type": "GrantPool",
-                        "name": qf_round.get("name", ""),
-                        "applications": []
+                # Everything below is the same for each of the project's rounds, so compute it once.
+                # Donations are summed in _enrich_projects; nothing is asked on Giveth, so the zero
+                # USD stub is shared between applications.
+                project_name = project.get("title", "")
+                created_at = self.format_iso_date(project.get("creationDate", ""))
+                content_uri = f"{self.config.base_uri}/project/{project.get('slug', project['id'])}"
+                is_inactive = project.get("status", {}).get("name", "").lower() == "inactive"
+                total_received = str(project["_total_received_usd"])
+                funds_approved = _USD_ZERO if total_received == "0" else [
+                    {
+                        "amount": total_received,
+                        "denomination": "USD"
                     }
+                ]
                 
-                # Calculate funding amounts from donations
-                total_asked = 0
-                total_received = 0
-                
-                if project.get("donations"):
-                    for donation in project["donations"]:
-                        if donation.get("valueUsd"):
-                            total_received += float(donation["valueUsd"])
-                
-                # Transform social media for application
-                socials = []
-                if project.get("socialMedia"):
-                    platform_map = {
-                        "twitter": "Twitter",
-                        "github": "GitHub", 
-                        "discord": "Discord",
-                        "telegram": "Telegram",
-                        "linkedin": "LinkedIn"
-                    }
+                for qf_round in project["qfRounds"]:
+                    round_id = qf_round["id"]
+                    pool_id = self.transform_to_caip10(f"0x{round_id}", "1")
                     
-                    for social in project["socialMedia"]:
-                        platform = platform_map.get(social.get("type", "").lower(), social.get("type", ""))
-                        if platform in ["Twitter", "Discord", "Telegram", "LinkedIn", "GitHub", "Farcaster", "Lens"]:
-                            socials.append({
-                                "platform": platform,
-                                "url": social.get("link", "")
-                            })
-                
-                application = {
-                    "type": "GrantApplication",
-                    "id": f"{pool_id}?proposal={project['id']}",
-                    "grantPoolsURI": f"{self.config.base_uri}/grant-pools.json",
-                    "grantPoolId": pool_id,
-                    "grantPoolName": qf_round.get("name", ""),
-                    "projectsURI": f"{self.config.base_uri}/projects.json",
-                    "projectId": project_id,
-                    "projectName": project.get("title", ""),
-                    "createdAt": self.format_iso_date(project.get("creationDate", "")),
-                    "contentURI": f"{self.config.base_uri}/project/{project.get('slug', project['id'])}",
-                    "discussionsTo": "",
-                    "licenseURI": "",
-                    "isInactive": project.get("status", {}).get("name", "").lower() == "inactive",
-                    "applicationCompletionRate": 100,  # Assume completed if in QF round
-                    "socials": socials,
-                    "fundsAsked": [
-                        {
-                            "amount": str(total_asked),
-                            "denomination": "USD"
-                        }
-                    ],
-                    "fundsAskedInUSD": str(total_asked),
-                    "fundsApproved": [
-                        {
-                            "amount": str(total_received),
-                            "denomination": "USD"
+                    if pool_id not in applications_by_pool:
+                        applications_by_pool[pool_id] = {
+                            "type": "GrantPool",
+                            "name": qf_round.get("name", ""),
+                            "applications": []
                         }
-                    ],
-                    "fundsApprovedInUSD": str(total_received),
-                    "payoutAddress": {
-                        "type": "EthereumAddress",
-                        "value": primary_address
-                    },
-                    "status": "approved" if qf_round.get("isActive") else "completed",
-                    "payouts": []
-                }
-                
-                applications_by_pool[pool_id]["applications"].append(application)
+                    
+                    application = {
+                        "type": "GrantApplication",
+                        "id": f"{pool_id}?proposal={project['id']}",
+                        "grantPoolsURI": grant_pools_uri,
+                        "grantPoolId": pool_id,
+                        "grantPoolName": qf_round.get("name", ""),
+                        "projectsURI": projects_uri,
+                        "projectId": project_id,
+                        "projectName": project_name,
+                        "createdAt": created_at,
+                        "contentURI": content_uri,
+                        "discussionsTo": "",
+                        "licenseURI": "",
+                        "isInactive": is_inactive,
+                        "applicationCompletionRate": 100,  # Assume completed if in QF round
+                        "socials": project["_socials_app"],
+                        "fundsAsked": _USD_ZERO,
+                        "fundsAskedInUSD": "0",
+                        "fundsApproved": funds_approved,
+                        "fundsApprovedInUSD": total_received,
+                        "payoutAddress": {
+                            "type": "EthereumAddress",
+                            "value": primary_address
+                        },
+                        "status": "approved" if qf_round.get("isActive") else "completed",
+                        "payouts": []
+                    }
+                    
+                    applications_by_pool[pool_id]["applications"].append(application)
+                    if jsonl_file is not None:
+                        jsonl_file.write(_dumps(application) + b'\n')
         
         return {
             "@context": "http://www.daostar.org/schemas",
@@ -414,8 +480,28 @@ class GivethDaoip5Transformer:
     def save_json_file(self, data: Dict, filename: str):
         """Save data to JSON file"""
         filepath = os.path.join(self.config.output_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson encodes straight to UTF-8 bytes, much faster for large outputs
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        logger.info(f"Saved {filename}")
+    
+    def save_applications_streaming(self, applications: Dict, filename: str):
+        """Save applications one grant pool at a time to bound the serialization buffer"""
+        filepath = os.path.join(self.config.output_dir, filename)
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            f.write(b'{')
+            for key, value in applications.items():
+                if key != "grantPools":
+                    f.write(_dumps(key) + b': ' + _dumps(value) + b',\n')
+            f.write(b'"grantPools": [')
+            for i, pool in enumerate(applications["grantPools"]):
+                f.write(b',\n' if i else b'\n')
+                f.write(_dumps(pool))
+            f.write(b'\n]}\n')
         logger.info(f"Saved {filename}")
     
     def run_transformation(self, project_limit: int = None):
@@ -424,28 +510,33 @@ class GivethDaoip5Transformer:
         
         try:
             # Fetch data from Giveth
-            logger.info("Fetching projects...")
-            projects = self.fetch_projects(limit=project_limit)
-            
-            logger.info("Fetching QF rounds...")
-            qf_rounds = self.fetch_qf_rounds()
+            logger.info("Fetching projects and QF rounds...")
+            projects, qf_rounds = self.fetch_projects_and_qf_rounds(limit=project_limit)
             
             # Transform to DAOIP-5 format
             logger.info("Transforming grant system...")
             grant_system = self.transform_grant_system()
-            self.save_json_file(grant_system, "grant-system.json")
             
             logger.info("Transforming grant pools...")
             grant_pools = self.transform_grant_pools(qf_rounds)
-            self.save_json_file(grant_pools, "grant-pools.json")
             
             logger.info("Transforming projects...")
             projects_data = self.transform_projects(projects)
-            self.save_json_file(projects_data, "projects.json")
             
             logger.info("Transforming applications...")
             applications = self.transform_applications(projects, qf_rounds)
-            self.save_json_file(applications, "applications.json")
+            
+            # All outputs are built, so write them concurrently to overlap encoding with disk I/O
+            outputs = [
+                (self.save_json_file, grant_system, "grant-system.json"),
+                (self.save_json_file, grant_pools, "grant-pools.json"),
+                (self.save_json_file, projects_data, "projects.json"),
+                (self.save_applications_streaming, applications, "applications.json")
+            ]
+            with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+                futures = [executor.submit(save, data, filename) for save, data, filename in outputs]
+                for future in futures:
+                    future.result()
             
             # Generate summary report
             summary = {
@@ -461,6 +552,8 @@ class GivethDaoip5Transformer:
                     "applications.json"
                 ]
             }
+            if self.config.applications_jsonl:
+                summary["output_files"].append("applications.jsonl")
             self.save_json_file(summary, "transformation-summary.json")
             
             logger.info("Transformation completed successfully!")
@@ -1,106 +1,4 @@
-def main():
-    """Main execution function"""
-    # Parse command line arguments
-    args = parse_arguments()
-    
-    # Configuration
-    config = OctantConfig(
-        base_url=args.base_url,
-        output_dir=args.output,
-        max_retries=args.retries
-    )
-    
-    # Create output directory
-    os.makedirs(config.output_dir, exist_ok=True)
-    
-    # Initialize API client and converter
-    api_client = OctantAPIClient(config)
-    converter = DAOIP5Converter(api_client)
-    
-    try:
-        # Get current epoch to determine range
-        current_epoch = api_client.get_current_epoch()
-        if current_epoch is None:
-            logger.error("Could not fetch current epoch")
-            return
-        
-        logger.info(f"Current epoch: {current_epoch}")
-        
-        # Determine epochs to process based on arguments
-        epochs_to_process = determine_epochs_to_process(args, current_epoch)
-        
-        logger.info(f"Processing epochs: {epochs_to_process}")
-        
-        # Validate epoch numbers
-        invalid_epochs = [e for e in epochs_to_process if e < 1 or e > current_epoch]
-        if invalid_epochs:
-            logger.warning(f"Invalid epoch numbers (must be 1-{current_epoch}): {invalid_epochs}")
-            epochs_to_process = [e for e in epochs_to_process if e not in invalid_epochs]
-        
-        if not epochs_to_process:
-            logger.error("No valid epochs to process")
-            return
-        
-        # Generate grants system
-        logger.info("Generating grants system...")
-        grants_system = converter.generate_grants_system()
-        with open(f"{config.output_dir}/grants_system.json", "w") as f:
-            json.dump(grants_system, f, indent=2)
-        
-        # Generate grant pools
-        logger.info("Generating grant pools...")
-        grant_pools = converter.generate_grant_pools(epochs_to_process)
-        with open(f"{config.output_dir}/grant_pools.json", "w") as f:
-            json.dump(grant_pools, f, indent=2)
-        
-        # Generate projects
-        logger.info("Generating projects...")
-        projects = converter.generate_projects(epochs_to_process)
-        with open(f"{config.output_dir}/projects.json", "w") as f:
-            json.dump(projects, f, indent=2)
-        
-        # Generate applications for each epoch
-        for epoch in epochs_to_process:
-            logger.info(f"Generating applications for epoch {epoch}...")
-            applications = converter.generate_applications(epoch)
-            with open(f"{config.output_dir}/applications_epoch_{epoch}.json", "w") as f:
-                json.dump(applications, f, indent=2)
-        
-        # Generate enhanced summary with metadata
-        indexed_epoch_info = api_client.get_indexed_epoch()
-        
-        summary = {
-            "conversion_completed_at": datetime.now().isoformat() + "Z",
-            "epochs_processed": epochs_to_process,
-            "total_epochs_processed": len(epochs_to_process),
-            "current_epoch": current_epoch,
-            "command_used": " ".join(sys.argv) if 'sys' in globals() else "python3 run.py",
-            "files_generated": [
-                "grants_system.json",
-                "grant_pools.json", 
-                "projects.json"
-            ] + [f"applications_epoch_{epoch}.json" for epoch in epochs_to_process],
-            "data_freshness": {
-                "api_endpoint": config.base_url,
-                "data_fetched_at": datetime.now().isoformat() + "Z",
-                "sync_status": indexed_epoch_info if indexed_epoch_info else "unavailable"
-            }
-        }
-        
-        with open(f"{config.output_dir}/generation_summary.json", "w") as f:
-            json.dump(summary, f, indent=2)
-        
-        logger.info(f"Successfully generated DAOIP-5 files in {config.output_dir}/")
-        logger.info(f"Processed {len(epochs_to_process)} epochs: {epochs_to_process}")
-        logger.info(f"Files: {summary['files_generated']}")
-        
-    except Exception as e:
-        logger.error(f"Error during conversion: {e}")
-        raise
-
-if __name__ == "__main__":
-    import sys
-    main()#!/usr/bin/env python3
+#!/usr/bin/env python3
 """
 Octant API to DAOIP-5 Data Converter
 
@@ -115,20 +13,60 @@ Usage:
     python3 run.py --epochs 3,4,5     # Process specific epochs
 """
 
+import hashlib
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import os
+import random
+import threading
 import argparse
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# ETH/USD rate cache lifetimes in seconds; rates for dates more than a day old never expire
+RATE_TTL_CURRENT = 5 * 60
+RATE_TTL_RECENT = 6 * 60 * 60
+
+# Files that don't belong to a single epoch, and how long they are reused while the current epoch is unchanged
+SHARED_OUTPUT_FILES = ("grants_system.json", "grant_pools.json", "projects.json")
+SHARED_OUTPUT_TTL = 60 * 60
+
+# Literals shared by every generated document
+DAOIP5_CONTEXT = "http://www.daostar.org/schemas"
+OCTANT_GOVERNANCE_URI = "https://docs.octant.app/how-it-works/mechanism"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# Octant epochs are 90 days, counted from an approximate start date for epoch 0
+EPOCH_0_START = datetime(2023, 10, 1)
+EPOCH_DURATION = timedelta(days=90)
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+@lru_cache(maxsize=None)
+def _epoch_bounds(epoch: int) -> Tuple[datetime, datetime]:
+    """Start and end dates of an epoch, memoized since every generator asks for the same few epochs"""
+    start_date = EPOCH_0_START + epoch * EPOCH_DURATION
+    return start_date, start_date + EPOCH_DURATION
+
 @dataclass
 class OctantConfig:
     """Configuration for Octant API endpoints"""
@@ -136,6 +74,9 @@ class OctantConfig:
     output_dir: str = "./daoip5_output"
     max_retries: int = 3
     retry_delay: float = 1.0
+    max_retry_delay: float = 30.0  # Cap on a single backoff sleep
+    max_concurrent_requests: int = 16  # Outbound requests in flight across all threads
+    max_workers: int = 8  # Concurrent epoch requests
     epochs_to_process: Optional[List[int]] = None  # None means all epochs
 
 class OctantAPIClient:
@@ -146,17 +87,48 @@ class OctantAPIClient:
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'DAOIP-5-Converter/1.0',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Connection': 'keep-alive'
         })
+        
+        # Pool connections to the Octant and CoinGecko hosts so concurrent epoch fetches reuse TLS sessions.
+        # Octant retries stay in _make_request, so that adapter itself doesn't retry.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0)
+        self.session.mount("https://", adapter)
+        
+        # CoinGecko lookups have no retry loop of their own, so retry transient gateway errors there
+        coingecko_retry = Retry(
+            total=config.max_retries,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504]
+        )
+        self.session.mount("https://api.coingecko.com/", HTTPAdapter(pool_maxsize=32, max_retries=coingecko_retry))
+        self._request_slots = threading.BoundedSemaphore(config.max_concurrent_requests)
+        
+        # ETH/USD rates persist across runs in the output directory
+        self._rate_cache_path = os.path.join(config.output_dir, ".ratecache.json")
+        self._rate_cache = self._load_rate_cache()
+        self._rate_lock = threading.Lock()
+        self._rate_key_locks: Dict[str, threading.Lock] = {}
+        
+        # Responses for finalized epochs never change, so they are kept on disk between runs
+        self._response_cache_dir = os.path.join(config.output_dir, ".apicache")
+        self.current_epoch: Optional[int] = None
     
-    def _make_request(self, endpoint: str, allow_404_400: bool = False) -> Optional[Dict]:
-        """Make HTTP request with retry logic"""
+    def _make_request(self, endpoint: str, allow_404_400: bool = False, immutable: bool = False) -> Optional[Dict]:
+        """Make HTTP request with retry logic; immutable responses are served from the disk cache"""
         url = f"{self.config.base_url}{endpoint}"
         
+        if immutable:
+            cached = self._read_cached_response(url)
+            if cached is not None:
+                return cached
+        
         for attempt in range(self.config.max_retries):
             try:
                 logger.info(f"Fetching: {endpoint}")
-                response = self.session.get(url, timeout=30)
+                with self._request_slots:
+                    response = self.session.get(url, timeout=30)
                 
                 # Handle expected 400/404 errors gracefully (e.g., epoch not concluded)
                 if allow_404_400 and response.status_code in [400, 404]:
@@ -164,8 +136,12 @@ class OctantAPIClient:
                     return None
                 
                 response.raise_for_status()
-                return response.json()
-            except requests.exceptions.RequestException as e:
+                data = _loads(response.content)
+                # Only bodies that parsed are cached, so a bad response is never replayed from disk
+                if immutable:
+                    self._write_cached_response(url, response.content)
+                return data
+            except (requests.exceptions.RequestException, ValueError) as e:  # ValueError: body isn't valid JSON
                 # Don't retry on 400/404 if they're expected
                 if allow_404_400 and hasattr(e, 'response') and e.response is not None and e.response.status_code in [400, 404]:
                     logger.info(f"Expected {e.response.status_code} error for {endpoint} - epoch likely not concluded")
@@ -173,44 +149,96 @@ class OctantAPIClient:
                 
                 logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
                 if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay * (2 ** attempt))
+                    time.sleep(self._retry_delay(attempt, getattr(e, 'response', None)))
                 else:
                     logger.error(f"Failed to fetch {endpoint} after {self.config.max_retries} attempts")
                     return None
     
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to wait before retrying: the server's Retry-After if given, else full-jitter backoff"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), self.config.max_retry_delay)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        
+        # Random delays keep concurrent workers from retrying in lockstep
+        return random.uniform(0, min(self.config.retry_delay * (2 ** attempt), self.config.max_retry_delay))
+    
+    def _response_cache_path(self, url: str) -> str:
+        """Path of the cached response for a URL"""
+        return os.path.join(self._response_cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+    
+    def _read_cached_response(self, url: str) -> Optional[Dict]:
+        """Load a cached response, or None if it is missing or unreadable"""
+        try:
+            with open(self._response_cache_path(url), "rb") as f:
+                content = f.read()
+            return _loads(content)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cached_response(self, url: str, content: bytes):
+        """Persist a raw response body for an immutable endpoint"""
+        path = self._response_cache_path(url)
+        try:
+            os.makedirs(self._response_cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache response for {url}: {e}")
+    
+    def is_epoch_finalized(self, epoch: int) -> bool:
+        """An epoch's data is final once it is at least two epochs behind the current one"""
+        return self.current_epoch is not None and epoch < self.current_epoch - 1
+    
     def get_current_epoch(self) -> Optional[int]:
         """Get current epoch number"""
         data = self._make_request("/epochs/current")
-        return data.get("currentEpoch") if data else None
+        self.current_epoch = data.get("currentEpoch") if data else None
+        return self.current_epoch
     
     def get_epoch_info(self, epoch: int) -> Optional[Dict]:
         """Get detailed epoch information"""
-        return self._make_request(f"/epochs/info/{epoch}")
+        return self._make_request(f"/epochs/info/{epoch}", immutable=self.is_epoch_finalized(epoch))
     
     def get_epoch_status(self, epoch: int) -> Optional[Dict]:
         """Get epoch status (current, pending, finalized)"""
-        return self._make_request(f"/snapshots/status/{epoch}")
+        return self._make_request(f"/snapshots/status/{epoch}", immutable=self.is_epoch_finalized(epoch))
     
     def get_projects_for_epoch(self, epoch: int) -> Optional[Dict]:
         """Get projects metadata for epoch"""
-        return self._make_request(f"/projects/epoch/{epoch}")
+        return self._make_request(f"/projects/epoch/{epoch}", immutable=self.is_epoch_finalized(epoch))
     
     def get_project_details(self, epochs: List[int], search_phrases: str = "") -> Optional[Dict]:
         """Get detailed project information"""
         epochs_str = ",".join(map(str, epochs))
-        return self._make_request(f"/projects/details?epochs={epochs_str}&searchPhrases={search_phrases}")
+        return self._make_request(
+            f"/projects/details?epochs={epochs_str}&searchPhrases={search_phrases}",
+            immutable=all(self.is_epoch_finalized(epoch) for epoch in epochs)
+        )
     
     def get_allocations_for_epoch(self, epoch: int, include_zero: bool = False) -> Optional[Dict]:
         """Get all allocations for an epoch"""
-        return self._make_request(f"/allocations/epoch/{epoch}?includeZeroAllocations={include_zero}")
+        return self._make_request(
+            f"/allocations/epoch/{epoch}?includeZeroAllocations={include_zero}",
+            immutable=self.is_epoch_finalized(epoch)
+        )
     
     def get_project_rewards(self, epoch: int) -> Optional[Dict]:
         """Get project rewards for epoch"""
-        return self._make_request(f"/rewards/projects/epoch/{epoch}", allow_404_400=True)
+        return self._make_request(
+            f"/rewards/projects/epoch/{epoch}", allow_404_400=True, immutable=self.is_epoch_finalized(epoch)
+        )
     
     def get_merkle_tree(self, epoch: int) -> Optional[Dict]:
         """Get merkle tree for epoch rewards"""
-        return self._make_request(f"/rewards/merkle_tree/{epoch}", allow_404_400=True)
+        return self._make_request(
+            f"/rewards/merkle_tree/{epoch}", allow_404_400=True, immutable=self.is_epoch_finalized(epoch)
+        )
     
     def get_chain_info(self) -> Optional[Dict]:
         """Get blockchain and contract information"""
@@ -220,20 +248,77 @@ class OctantAPIClient:
         """Get version and deployment information"""
         return self._make_request("/info/version")
     
+    def get_indexed_epoch(self) -> Optional[Dict]:
+        """Get current and last indexed epoch"""
+        return self._make_request("/epochs/indexed")
+    
     def get_eth_to_usd_rate(self, date: Optional[str] = None) -> Optional[float]:
         """
         Get ETH to USD exchange rate for a specific date or current rate
         
         Args:
-            date: Date in YYYY-MM-DD format. If None, gets current rate.
+            date: Date in DD-MM-YYYY format. If None, gets current rate.
         """
+        key = date or "current"
+        with self._rate_lock:
+            key_lock = self._rate_key_locks.setdefault(key, threading.Lock())
+        
+        # Callers asking for the same rate wait on the in-flight request instead of repeating it
+        with key_lock:
+            cached = self._rate_cache.get(key)
+            if cached and self._is_rate_fresh(date, cached["fetched_at"]):
+                return cached["price"]
+            
+            price = self._fetch_eth_to_usd_rate(date)
+            if price:
+                self._store_rate(key, price)
+            return price
+    
+    def _is_rate_fresh(self, date: Optional[str], fetched_at: float) -> bool:
+        """Check a cached rate against its TTL"""
+        if date is None:
+            ttl = RATE_TTL_CURRENT
+        else:
+            try:
+                day = datetime.strptime(date, "%d-%m-%Y")
+            except ValueError:
+                return False
+            if day < datetime.now() - timedelta(days=1):
+                return True  # Historical prices don't change
+            ttl = RATE_TTL_RECENT
+        return time.time() - fetched_at < ttl
+    
+    def _load_rate_cache(self) -> Dict[str, Dict]:
+        """Load the on-disk ETH/USD rate cache, ignoring a missing or corrupt file"""
+        try:
+            with open(self._rate_cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _store_rate(self, key: str, price: float):
+        """Record a fetched rate and persist the cache"""
+        with self._rate_lock:
+            self._rate_cache[key] = {"price": price, "fetched_at": time.time()}
+            try:
+                os.makedirs(self.config.output_dir, exist_ok=True)
+                tmp_path = f"{self._rate_cache_path}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(self._rate_cache, f)
+                os.replace(tmp_path, self._rate_cache_path)
+            except OSError as e:
+                logger.warning(f"Could not write ETH/USD rate cache: {e}")
+    
+    def _fetch_eth_to_usd_rate(self, date: Optional[str] = None) -> Optional[float]:
+        """Fetch an ETH to USD rate from CoinGecko"""
         try:
             if date:
                 # Historical price for specific date
                 url = f"https://api.coingecko.com/api/v3/coins/ethereum/history?date={date}"
-                response = self.session.get(url, timeout=10)
+                with self._request_slots:
+                    response = self.session.get(url, timeout=10)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _loads(response.content)
                     price = data.get("market_data", {}).get("current_price", {}).get("usd")
                     if price:
                         logger.info(f"Historical ETH/USD rate for {date}: ${price:,.2f}")
@@ -241,9 +326,10 @@ class OctantAPIClient:
             else:
                 # Current price
                 url = "https://api.coingecko.com/api/v3/simple/price?ids=ethereum&vs_currencies=usd"
-                response = self.session.get(url, timeout=10)
+                with self._request_slots:
+                    response = self.session.get(url, timeout=10)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _loads(response.content)
                     price = data.get("ethereum", {}).get("usd")
                     if price:
                         logger.info(f"Current ETH/USD rate: ${price:,.2f}")
@@ -256,9 +342,8 @@ class OctantAPIClient:
     def get_eth_price_for_epoch_end(self, epoch: int) -> Optional[float]:
         """Get ETH price for when the epoch ended/was finalized"""
         try:
-            # Calculate approximate epoch end date (90 days per epoch)
-            epoch_0_start = datetime(2023, 10, 1)  # Approximate Octant start
-            epoch_end = epoch_0_start + timedelta(days=(epoch + 1) * 90)
+            # Approximate epoch end date (90 days per epoch)
+            _, epoch_end = _epoch_bounds(epoch)
             date_str = epoch_end.strftime("%d-%m-%Y")  # CoinGecko format: DD-MM-YYYY
             
             return self.get_eth_to_usd_rate(date_str)
@@ -274,13 +359,28 @@ class DAOIP5Converter:
         self.chain_info = None
         self.version_info = None
         self.indexed_epoch_info = None
+        self.current_eth_usd_rate = None
         self.eth_usd_rates = {}  # Store rates per epoch
+        self._caip_prefix = "eip155:1:"  # Default to mainnet until chain info is loaded
+        self._zero_caip = self._caip_prefix + ZERO_ADDRESS
+        self.generated_at = _utc_now_iso()  # Shared timestamp for everything generated in this run
+        self._static_metadata: Optional[Dict] = None  # Sync, version and chain parts of the freshness metadata
     
-    def _load_system_info(self):
+    def load_system_info(self):
         """Load chain and version information"""
-        self.chain_info = self.api.get_chain_info()
-        self.version_info = self.api.get_version_info()
-        self.indexed_epoch_info = self.api.get_indexed_epoch()
+        # The lookups are independent, so their round trips overlap
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            chain_future = executor.submit(self.api.get_chain_info)
+            version_future = executor.submit(self.api.get_version_info)
+            indexed_future = executor.submit(self.api.get_indexed_epoch)
+            rate_future = executor.submit(self.api.get_eth_to_usd_rate)
+        self.chain_info = chain_future.result()
+        self.version_info = version_future.result()
+        self.indexed_epoch_info = indexed_future.result()
+        self.current_eth_usd_rate = rate_future.result()
+        self._static_metadata = None
+        self._caip_prefix = f"eip155:{(self.chain_info or {}).get('chainId', 1)}:"
+        self._zero_caip = self._caip_prefix + ZERO_ADDRESS
     
     def _get_eth_rate_for_epoch(self, epoch: int) -> Optional[float]:
         """Get ETH/USD rate for a specific epoch, with caching"""
@@ -300,35 +400,72 @@ class DAOIP5Converter:
         
         return rate
     
+    def resolve_epoch_rates(self, epochs: List[int]):
+        """Look up the ETH/USD rate for each epoch up front, so per-epoch files see a fixed set"""
+        with ThreadPoolExecutor(max_workers=self.api.config.max_workers) as executor:
+            list(executor.map(self._get_eth_rate_for_epoch, epochs))
+    
     def _wei_to_eth_str(self, wei_amount: str) -> str:
-        """Convert wei amount string to ETH string"""
+        """Convert wei amount string to ETH string, rounded to 6 decimal places"""
         try:
             wei_int = int(wei_amount)
-            eth_amount = wei_int / 10**18
-            return f"{eth_amount:.6f}".rstrip('0').rstrip('.')
         except (ValueError, TypeError):
             return "0"
+        
+        # Integer math keeps large amounts exact where a float would lose precision
+        micro_eth = (abs(wei_int) + 5 * 10**11) // 10**12
+        whole, frac = divmod(micro_eth, 10**6)
+        sign = "-" if wei_int < 0 and micro_eth else ""
+        frac_str = f"{frac:06d}".rstrip("0")
+        return f"{sign}{whole}.{frac_str}" if frac_str else f"{sign}{whole}"
     
-    def _wei_to_usd_str(self, wei_amount: str, epoch: int) -> Optional[str]:
-        """Convert wei amount string to USD string using epoch-specific rate"""
+    def _wei_to_usd_batch(self, wei_amounts: List[int], epoch: int) -> List[Optional[str]]:
+        """Convert a list of wei integers to USD strings, looking up the epoch rate once"""
         eth_rate = self._get_eth_rate_for_epoch(epoch)
         if not eth_rate:
-            return None
+            return [None] * len(wei_amounts)
         
-        try:
-            wei_int = int(wei_amount)
-            eth_amount = wei_int / 10**18
-            usd_amount = eth_amount * eth_rate
-            return f"{usd_amount:.2f}"
-        except (ValueError, TypeError):
-            return None
+        return [f"{wei_int / 10**18 * eth_rate:.2f}" for wei_int in wei_amounts]
     
-    def _get_data_freshness_metadata(self) -> Dict:
-        """Generate metadata about data freshness and sync status"""
-        current_time = datetime.now()
+    def _get_data_freshness_metadata(self, rates_through_epoch: Optional[int] = None) -> Dict:
+        """
+        Generate metadata about data freshness and sync status. Per-epoch documents pass
+        rates_through_epoch to include the historical rates of epochs up to and including it;
+        documents that span all epochs leave the per-epoch rates out.
+        """
+        # Only the exchange rates change during a run; the rest is built once per system info load.
+        # Callers add their own top-level keys, so each gets a shallow copy.
+        if self._static_metadata is None:
+            self._static_metadata = self._build_static_metadata()
+        metadata = dict(self._static_metadata)
+        
+        # Add ETH/USD rate information, reusing the rate fetched with the system info
+        if self.current_eth_usd_rate is None:
+            self.current_eth_usd_rate = self.api.get_eth_to_usd_rate()
+        current_rate = self.current_eth_usd_rate
+        epoch_rates = {}
+        if rates_through_epoch is not None:
+            rates = dict(self.eth_usd_rates)  # Snapshot; epoch workers may still be adding to it
+            epoch_rates = {e: rates[e] for e in sorted(rates) if e <= rates_through_epoch}
+        if current_rate or epoch_rates:
+            rate_info = {
+                "current_eth_usd_rate": current_rate,
+                "rate_fetched_at": self.generated_at,
+                "rate_source": "CoinGecko API"
+            }
+            
+            # Add historical rates if we have them
+            if epoch_rates:
+                rate_info["historical_rates_by_epoch"] = epoch_rates
+            
+            metadata["exchange_rates"] = rate_info
         
+        return metadata
+    
+    def _build_static_metadata(self) -> Dict:
+        """Build the freshness metadata that doesn't depend on exchange rates"""
         metadata = {
-            "data_fetched_at": current_time.isoformat() + "Z",
+            "data_fetched_at": self.generated_at,
             "api_endpoint": self.api.config.base_url,
             "sync_status": {}
         }
@@ -360,49 +497,22 @@ class DAOIP5Converter:
                 "chain_name": self.chain_info.get("chainName")
             }
         
-        # Add ETH/USD rate information
-        current_rate = self.api.get_eth_to_usd_rate()
-        if current_rate or self.eth_usd_rates:
-            rate_info = {
-                "current_eth_usd_rate": current_rate,
-                "rate_fetched_at": current_time.isoformat() + "Z",
-                "rate_source": "CoinGecko API"
-            }
-            
-            # Add historical rates if we have them
-            if self.eth_usd_rates:
-                rate_info["historical_rates_by_epoch"] = self.eth_usd_rates
-            
-            metadata["exchange_rates"] = rate_info
-        
         return metadata
     
     def _generate_caip10_address(self, address: str) -> str:
         """Generate CAIP-10 formatted address"""
-        if not self.chain_info:
-            return f"eip155:1:{address}"  # Default to mainnet
-        
-        chain_id = self.chain_info.get("chainId", 1)
-        return f"eip155:{chain_id}:{address}"
+        return self._caip_prefix + address
     
     def _calculate_epoch_dates(self, epoch: int) -> tuple:
         """Calculate epoch start and end dates (90-day epochs)"""
-        # Octant epochs are 90 days, starting from a reference point
-        epoch_duration_days = 90
-        # Approximate start date for epoch 0
-        epoch_0_start = datetime(2023, 10, 1)
-        
-        start_date = epoch_0_start + timedelta(days=epoch * epoch_duration_days)
-        end_date = start_date + timedelta(days=epoch_duration_days)
-        
-        return start_date, end_date
+        return _epoch_bounds(epoch)
     
     def generate_grants_system(self) -> Dict:
         """Generate DAOIP-5 grants system JSON"""
-        self._load_system_info()
+        self.load_system_info()
         
         system_data = {
-            "@context": "http://www.daostar.org/schemas",
+            "@context": DAOIP5_CONTEXT,
             "name": "Octant",
             "type": "Foundation",
             "description": "A decentralized grants platform using quadratic funding to support public goods",
@@ -428,19 +538,21 @@ class DAOIP5Converter:
         """Generate DAOIP-5 grant pools JSON for given epochs"""
         grant_pools = []
         
-        for epoch in epochs:
+        # Epoch info and status are independent requests, so fetch them for all epochs at once
+        with ThreadPoolExecutor(max_workers=self.api.config.max_workers) as executor:
+            epoch_infos = executor.map(self.api.get_epoch_info, epochs)
+            epoch_statuses = executor.map(self.api.get_epoch_status, epochs)
+            epoch_infos, epoch_statuses = list(epoch_infos), list(epoch_statuses)
+        
+        for epoch, epoch_info, epoch_status in zip(epochs, epoch_infos, epoch_statuses):
             logger.info(f"Processing epoch {epoch}")
             
-            # Get epoch information
-            epoch_info = self.api.get_epoch_info(epoch)
-            epoch_status = self.api.get_epoch_status(epoch)
-            
             if not epoch_info or not epoch_status:
                 logger.warning(f"Could not fetch data for epoch {epoch}")
                 continue
             
             start_date, end_date = self._calculate_epoch_dates(epoch)
-            pool_id = self._generate_caip10_address("0x0000000000000000000000000000000000000000") + f"?contractId={epoch}"
+            pool_id = self._zero_caip + f"?contractId={epoch}"
             
             grant_pool = {
                 "type": "GrantPool",
@@ -451,7 +563,7 @@ class DAOIP5Converter:
                 "isOpen": epoch_status.get("isCurrent", False),
                 "closeDate": end_date.isoformat() + "Z",
                 "applicationsURI": f"./applications_epoch_{epoch}.json",
-                "governanceURI": "https://docs.octant.app/how-it-works/mechanism",
+                "governanceURI": OCTANT_GOVERNANCE_URI,
                 "totalGrantPoolSize": [
                     {
                         "amount": epoch_info.get("totalRewards", "0"),
@@ -475,7 +587,7 @@ class DAOIP5Converter:
             grant_pools.append(grant_pool)
         
         result = {
-            "@context": "http://www.daostar.org/schemas",
+            "@context": DAOIP5_CONTEXT,
             "name": "Octant",
             "type": "Foundation",
             "grantPools": grant_pools
@@ -492,32 +604,38 @@ class DAOIP5Converter:
         """Generate DAOIP-5 projects JSON"""
         all_projects = {}
         
-        for epoch in epochs:
-            logger.info(f"Fetching projects for epoch {epoch}")
-            
+        # Fetch metadata for every epoch concurrently, alongside a single details request
+        # covering all epochs; merging below stays in epoch order
+        logger.info(f"Fetching projects for epochs {epochs}")
+        with ThreadPoolExecutor(max_workers=self.api.config.max_workers) as executor:
+            details_future = executor.submit(self.api.get_project_details, epochs)
+            epoch_projects = list(executor.map(self.api.get_projects_for_epoch, epochs))
+        project_details = details_future.result()
+        
+        # Create mapping for easier lookup. Details carry their epoch, so key by (epoch, address);
+        # fall back to address alone if the response doesn't include it.
+        detail_map = {}
+        if project_details and "projectsDetails" in project_details:
+            for detail in project_details["projectsDetails"]:
+                if "epoch" in detail:
+                    detail_map.setdefault((str(detail["epoch"]), detail.get("address")), detail)
+                else:
+                    detail_map.setdefault(detail.get("address"), detail)
+        
+        for epoch, projects_data in zip(epochs, epoch_projects):
             # Get project metadata
-            projects_data = self.api.get_projects_for_epoch(epoch)
             if not projects_data:
                 continue
             
             project_addresses = projects_data.get("projectsAddresses", [])
             projects_cid = projects_data.get("projectsCid")
             
-            # Get detailed project information
-            project_details = self.api.get_project_details([epoch])
-            
-            # Create mapping for easier lookup
-            detail_map = {}
-            if project_details and "projectsDetails" in project_details:
-                for detail in project_details["projectsDetails"]:
-                    detail_map[detail.get("address")] = detail
-            
             for address in project_addresses:
                 if address not in all_projects:
                     project_id = self._generate_caip10_address(address) + "?proposalId=1"
                     
                     # Find project details
-                    detail = detail_map.get(address, {})
+                    detail = detail_map.get((str(epoch), address)) or detail_map.get(address, {})
                     project_name = detail.get("name", f"Project {address[:8]}...")
                     
                     project = {
@@ -537,7 +655,7 @@ class DAOIP5Converter:
                     all_projects[address]["relevantTo"].append(f"Octant Epoch {epoch}")
         
         result = {
-            "@context": "http://www.daostar.org/schemas",
+            "@context": DAOIP5_CONTEXT,
             "name": "Octant Projects",
             "type": "ProjectRegistry",
             "projects": list(all_projects.values())
@@ -556,11 +674,14 @@ class DAOIP5Converter:
         logger.info(f"Generating applications for epoch {epoch}")
         
         # Get allocations and rewards data
-        allocations_data = self.api.get_allocations_for_epoch(epoch)
-        rewards_data = self.api.get_project_rewards(epoch)
-        merkle_data = self.api.get_merkle_tree(epoch)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            allocations_future = executor.submit(self.api.get_allocations_for_epoch, epoch)
+            rewards_future = executor.submit(self.api.get_project_rewards, epoch)
+            merkle_future = executor.submit(self.api.get_merkle_tree, epoch)
+        allocations_data = allocations_future.result()
+        rewards_data = rewards_future.result()
+        merkle_data = merkle_future.result()
         
-        applications = []
         epoch_concluded = True
         epoch_status = "completed"
         
@@ -589,7 +710,7 @@ class DAOIP5Converter:
             }
             
             result = {
-                "@context": "http://www.daostar.org/schemas",
+                "@context": DAOIP5_CONTEXT,
                 "name": "Octant",
                 "type": "Foundation",
                 "grantPools": [
@@ -607,118 +728,68 @@ class DAOIP5Converter:
             }
             
             # Add metadata using standard approach
-            result["_metadata"] = self._get_data_freshness_metadata()
+            result["_metadata"] = self._get_data_freshness_metadata(rates_through_epoch=epoch)
             result["_metadata"]["epoch_processed"] = epoch
             result["_metadata"]["epoch_conclusion_status"] = epoch_status
             
             return result
 
         # Process allocations into applications for concluded epochs
-        project_allocations = {}
+        project_allocations = defaultdict(list)
         allocations = allocations_data.get("allocations", [])
         
-        # Group allocations by project
+        # Group allocation amounts by project; donors aren't part of the application output
         for allocation in allocations:
-            project = allocation.get("project")
-            donor = allocation.get("donor")
-            amount = allocation.get("amount", "0")
-            
-            if project not in project_allocations:
-                project_allocations[project] = {
-                    "totalAllocated": 0,
-                    "donors": [],
-                    "allocations": []
-                }
-            
-            project_allocations[project]["totalAllocated"] += int(amount)
-            project_allocations[project]["donors"].append(donor)
-            project_allocations[project]["allocations"].append(allocation)
+            project_allocations[allocation.get("project")].append(allocation.get("amount", "0"))
+        
+        # Index rewards and merkle leaves by lowercased address (first entry wins), so checksummed
+        # and lowercase forms of the same address still match across endpoints
+        rewards_by_addr = {}
+        for reward in rewards_data.get("rewards", []):
+            rewards_by_addr.setdefault((reward.get("address") or "").lower(), reward)
+        leaves_by_addr = {}
+        for leaf in merkle_data.get("leaves", []):
+            leaves_by_addr.setdefault((leaf.get("address") or "").lower(), leaf)
+        
+        # Sum the raw wei strings once per project rather than per allocation
+        allocated_totals = [sum(map(int, amounts)) for amounts in project_allocations.values()]
+        project_rewards = [rewards_by_addr.get(address.lower()) for address in project_allocations]
+        matched_amounts = [int(rewards.get("matched", "0")) if rewards else 0 for rewards in project_rewards]
+        
+        # Approved USD covers matched funding when the project has rewards; each project's
+        # total is converted exactly once, in a single pass
+        approved_totals_usd = self._wei_to_usd_batch(
+            [
+                total_allocated + matched if rewards else total_allocated
+                for total_allocated, rewards, matched in zip(allocated_totals, project_rewards, matched_amounts)
+            ],
+            epoch
+        )
         
         # Create applications
-        app_counter = 1
-        
-        for project_address, data in project_allocations.items():
-            # Find project rewards
-            project_rewards = None
-            if rewards_data and "rewards" in rewards_data:
-                for reward in rewards_data["rewards"]:
-                    if reward.get("address") == project_address:
-                        project_rewards = reward
-                        break
-            
-            # Determine application status
-            status = "pending"
-            if project_rewards:
-                total_reward = int(project_rewards.get("allocated", "0")) + int(project_rewards.get("matched", "0"))
-                if total_reward > 0:
-                    status = "funded"
-                elif int(project_rewards.get("allocated", "0")) > 0:
-                    status = "approved"
-            
-            # Create payout information
-            payouts = []
-            if project_rewards and merkle_data:
-                # Find merkle proof for this project
-                for leaf in merkle_data.get("leaves", []):
-                    if leaf.get("address") == project_address:
-                        payouts.append({
-                            "type": "OnchainTransaction",
-                            "value": {
-                                "amount": leaf.get("amount"),
-                                "merkleRoot": merkle_data.get("root"),
-                                "recipient": project_address
-                            },
-                            "proof": f"merkle_proof_epoch_{epoch}_{project_address}"
-                        })
-                        break
-            
-            application = {
-                "type": "GrantApplication",
-                "id": self._generate_caip10_address("0x0000000000000000000000000000000000000000") + f"?proposalId={app_counter}",
-                "grantPoolId": self._generate_caip10_address("0x0000000000000000000000000000000000000000") + f"?contractId={epoch}",
-                "grantPoolName": f"Octant Epoch {epoch}",
-                "projectId": self._generate_caip10_address(project_address) + "?proposalId=1",
-                "projectName": f"Project {project_address[:8]}...",
-                "createdAt": datetime.now().isoformat() + "Z",
-                "fundsAsked": [
-                    {
-                        "amount": "0",  # Octant doesn't have explicit ask amounts
-                        "denomination": "ETH"
-                    }
-                ],
-                "fundsApproved": [
-                    {
-                        "amount": str(data["totalAllocated"]),
-                        "denomination": "ETH"
-                    }
-                ],
-                "fundsApprovedInUSD": self._wei_to_usd_str(str(data["totalAllocated"]), epoch),
-                "status": status,
-                "payouts": payouts
-            }
-            
-            # Add optional DAOIP-5 fields if data is available
-            if project_rewards:
-                matched_amount = project_rewards.get("matched", "0")
-                total_amount = str(data["totalAllocated"] + int(matched_amount))
-                
-                # Add matched funding info using standard fields
-                application["fundsApproved"].append({
-                    "amount": matched_amount,
-                    "denomination": "ETH",
-                    "type": "matched_funding"
-                })
-                
-                # Add USD conversion for matched funding
-                matched_usd = self._wei_to_usd_str(matched_amount, epoch)
-                if matched_usd:
-                    application["fundsApprovedInUSD"] = self._wei_to_usd_str(total_amount, epoch)
-            
-            applications.append(application)
-            app_counter += 1
+        grant_pool_id = self._zero_caip + f"?contractId={epoch}"
+        applications = [
+            _build_application(
+                epoch=epoch,
+                application_id=self._zero_caip + f"?proposalId={app_number}",
+                grant_pool_id=grant_pool_id,
+                project_id=self._generate_caip10_address(project_address) + "?proposalId=1",
+                project_address=project_address,
+                total_allocated=total_allocated,
+                approved_usd=approved_usd,
+                rewards=rewards,
+                matched=matched,
+                leaf=leaves_by_addr.get(project_address.lower()) if rewards else None,
+                merkle_root=merkle_data.get("root"),
+                created_at=self.generated_at
+            )
+            for app_number, (project_address, total_allocated, approved_usd, rewards, matched) in enumerate(
+                zip(project_allocations, allocated_totals, approved_totals_usd, project_rewards, matched_amounts), start=1
+            )
+        ]
         
         result = {
-            "@context": "http://www.daostar.org/schemas",
+            "@context": DAOIP5_CONTEXT,
             "name": "Octant",
             "type": "Foundation",
             "grantPools": [
@@ -737,7 +808,7 @@ class DAOIP5Converter:
         }
         
         # Add metadata using only standard fields and underscore prefixed metadata
-        result["_metadata"] = self._get_data_freshness_metadata()
+        result["_metadata"] = self._get_data_freshness_metadata(rates_through_epoch=epoch)
         result["_metadata"]["epoch_processed"] = epoch
         result["_metadata"]["epoch_conclusion_status"] = epoch_status
         result["_metadata"]["data_completeness"] = {
@@ -749,6 +820,144 @@ class DAOIP5Converter:
         
         return result
 
+def _build_application(epoch: int, application_id: str, grant_pool_id: str, project_id: str,
+                       project_address: str, total_allocated: int, approved_usd: Optional[str],
+                       rewards: Optional[Dict], matched: int, leaf: Optional[Dict], merkle_root: Optional[str],
+                       created_at: str) -> Dict:
+    """Build the DAOIP-5 application for one project's allocations in a concluded epoch"""
+    # Determine application status
+    status = "pending"
+    if rewards:
+        allocated = int(rewards.get("allocated", "0"))
+        if allocated + matched > 0:
+            status = "funded"
+        elif allocated > 0:
+            status = "approved"
+    
+    funds_approved = [
+        {
+            "amount": str(total_allocated),
+            "denomination": "ETH"
+        }
+    ]
+    if rewards:
+        # Add matched funding info using standard fields
+        funds_approved.append({
+            "amount": rewards.get("matched", "0"),
+            "denomination": "ETH",
+            "type": "matched_funding"
+        })
+    
+    # Create payout information from the project's merkle leaf
+    payouts = [
+        {
+            "type": "OnchainTransaction",
+            "value": {
+                "amount": leaf.get("amount"),
+                "merkleRoot": merkle_root,
+                "recipient": project_address
+            },
+            "proof": f"merkle_proof_epoch_{epoch}_{project_address}"
+        }
+    ] if leaf else []
+    
+    return {
+        "type": "GrantApplication",
+        "id": application_id,
+        "grantPoolId": grant_pool_id,
+        "grantPoolName": f"Octant Epoch {epoch}",
+        "projectId": project_id,
+        "projectName": f"Project {project_address[:8]}...",
+        "createdAt": created_at,
+        "fundsAsked": [
+            {
+                "amount": "0",  # Octant doesn't have explicit ask amounts
+                "denomination": "ETH"
+            }
+        ],
+        "fundsApproved": funds_approved,
+        "fundsApprovedInUSD": approved_usd,
+        "status": status,
+        "payouts": payouts
+    }
+
+def _loads(content: bytes) -> Any:
+    """
+    Parse a raw JSON body straight from bytes, skipping the decode-to-str copy.
+    Invalid input raises ValueError with either backend, so callers catch that.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def write_json_file(obj: Any, path: str, pretty: bool = False):
+    """Write obj as compact JSON, or indented if pretty, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        with open(path, "wb", buffering=1 << 20) as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        with open(path, "w", buffering=1 << 20) as f:
+            f.write(json.dumps(obj, indent=2) if pretty else json.dumps(obj, separators=(",", ":")))
+
+def write_json_streaming(obj: Any, path: str, stream_keys: frozenset = frozenset({"grantPools", "applications"})):
+    """
+    Write obj as JSON through a 1 MiB buffer, serializing the lists under
+    stream_keys one element at a time so no single huge string is built.
+    """
+    with open(path, "wb", buffering=1 << 20) as f:
+        _write_json_value(f, obj, stream_keys)
+        f.write(b"\n")
+
+def _write_json_value(f, obj: Any, stream_keys: frozenset):
+    """Recursive helper for write_json_streaming"""
+    # Anything without a streamed list below it (e.g. a single application) is encoded in one call
+    if not isinstance(obj, dict) or stream_keys.isdisjoint(obj):
+        f.write(_dumps(obj))
+        return
+    
+    f.write(b"{")
+    for i, (key, value) in enumerate(obj.items()):
+        if i:
+            f.write(b",")
+        f.write(_dumps(str(key)) + b":")
+        if key in stream_keys and isinstance(value, list):
+            f.write(b"[")
+            for j, item in enumerate(value):
+                f.write(b",\n" if j else b"\n")
+                _write_json_value(f, item, stream_keys)
+            f.write(b"]")
+        else:
+            f.write(_dumps(value))
+    f.write(b"}")
+
+def shared_outputs_are_fresh(output_dir: str, base_url: str, current_epoch: int, epochs: List[int], pretty: bool) -> bool:
+    """
+    Whether the last run covered the same epochs of the same backend at the same current
+    epoch, in the same output format, recently enough to reuse its shared files
+    """
+    try:
+        with open(os.path.join(output_dir, ".state.json"), "rb") as f:
+            state = _loads(f.read())
+        oldest = min(os.path.getmtime(os.path.join(output_dir, name)) for name in SHARED_OUTPUT_FILES)
+    except (OSError, ValueError):
+        return False
+    
+    return (
+        isinstance(state, dict)
+        and state.get("base_url") == base_url
+        and state.get("current_epoch") == current_epoch
+        and state.get("epochs") == epochs
+        and state.get("pretty") == pretty
+        and time.time() - oldest < SHARED_OUTPUT_TTL
+    )
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -762,6 +971,7 @@ Examples:
     python3 run.py --latest           # Process only latest/most recent epoch
     python3 run.py --epochs 3,4,5     # Process specific epochs (comma-separated)
     python3 run.py --output ./data    # Use custom output directory
+    python3 run.py --pretty           # Write indented JSON for reading by hand
         """
     )
     
@@ -807,6 +1017,16 @@ Examples:
         default=3,
         help="Number of API request retries (default: 3)"
     )
+    parser.add_argument(
+        "--force", 
+        action="store_true", 
+        help="Regenerate grants system, grant pools and projects even if the current epoch is unchanged"
+    )
+    parser.add_argument(
+        "--pretty", 
+        action="store_true", 
+        help="Write indented JSON instead of compact output"
+    )
     
     return parser.parse_args()
 
@@ -816,8 +1036,8 @@ def determine_epochs_to_process(args, current_epoch: int) -> List[int]:
         return [args.epoch]
     elif args.epochs:
         try:
-            epochs = [int(e.strip()) for e in args.epochs.split(",")]
-            return sorted(set(epochs))  # Remove duplicates and sort
+            # int() ignores surrounding whitespace; the set removes duplicates and empty entries are skipped
+            return sorted({int(e) for e in args.epochs.split(",") if e.strip()})
         except ValueError:
             raise ValueError("Invalid epochs format. Use comma-separated integers (e.g., '3,4,5')")
     elif args.current or args.latest:
@@ -828,8 +1048,15 @@ def determine_epochs_to_process(args, current_epoch: int) -> List[int]:
 
 def main():
     """Main execution function"""
+    # Parse command line arguments
+    args = parse_arguments()
+    
     # Configuration
-    config = OctantConfig()
+    config = OctantConfig(
+        base_url=args.base_url,
+        output_dir=args.output,
+        max_retries=args.retries
+    )
     
     # Create output directory
     os.makedirs(config.output_dir, exist_ok=True)
@@ -847,52 +1074,109 @@ def main():
         
         logger.info(f"Current epoch: {current_epoch}")
         
-        # Define epochs to process (current and all previous epochs down to 1)
-        epochs_to_process = list(range(1, current_epoch + 1))
+        # Determine epochs to process based on arguments
+        epochs_to_process = determine_epochs_to_process(args, current_epoch)
         
         logger.info(f"Processing epochs: {epochs_to_process}")
         
-        # Generate grants system
-        logger.info("Generating grants system...")
-        grants_system = converter.generate_grants_system()
-        with open(f"{config.output_dir}/grants_system.json", "w") as f:
-            json.dump(grants_system, f, indent=2)
-        
-        # Generate grant pools
-        logger.info("Generating grant pools...")
-        grant_pools = converter.generate_grant_pools(epochs_to_process)
-        with open(f"{config.output_dir}/grant_pools.json", "w") as f:
-            json.dump(grant_pools, f, indent=2)
-        
-        # Generate projects
-        logger.info("Generating projects...")
-        projects = converter.generate_projects(epochs_to_process)
-        with open(f"{config.output_dir}/projects.json", "w") as f:
-            json.dump(projects, f, indent=2)
-        
-        # Generate applications for each epoch
-        for epoch in epochs_to_process:
-            logger.info(f"Generating applications for epoch {epoch}...")
+        # Validate epoch numbers
+        invalid_epochs = [e for e in epochs_to_process if e < 1 or e > current_epoch]
+        if invalid_epochs:
+            logger.warning(f"Invalid epoch numbers (must be 1-{current_epoch}): {invalid_epochs}")
+            epochs_to_process = [e for e in epochs_to_process if e not in invalid_epochs]
+        
+        if not epochs_to_process:
+            logger.error("No valid epochs to process")
+            return
+        
+        # Files that aren't per-epoch only change when the current epoch does, unless --force is given
+        reuse_shared = not args.force and shared_outputs_are_fresh(
+            config.output_dir, config.base_url, current_epoch, epochs_to_process, args.pretty
+        )
+        if reuse_shared:
+            logger.info("Current epoch unchanged since the last run; reusing grants system, grant pools and projects (use --force to regenerate)")
+            converter.load_system_info()
+        else:
+            # Generate grants system
+            logger.info("Generating grants system...")
+            grants_system = converter.generate_grants_system()
+            write_json_file(grants_system, f"{config.output_dir}/grants_system.json", pretty=args.pretty)
+        
+        def process_epoch(epoch: int) -> int:
+            """Fetch and write one epoch's applications file"""
             applications = converter.generate_applications(epoch)
-            with open(f"{config.output_dir}/applications_epoch_{epoch}.json", "w") as f:
-                json.dump(applications, f, indent=2)
+            path = f"{config.output_dir}/applications_epoch_{epoch}.json"
+            if args.pretty:
+                write_json_file(applications, path, pretty=True)
+            else:
+                write_json_streaming(applications, path)
+            return epoch
+        
+        # Rates are resolved before the epoch workers start, so each applications file lists
+        # the same historical rates on every run
+        converter.resolve_epoch_rates(epochs_to_process)
+        
+        # Applications only need the system info loaded above, so every epoch is started now and
+        # runs in the background while grant pools and projects are generated. Each worker overlaps
+        # its epoch's API calls with other epochs' file writes.
+        logger.info(f"Generating applications for epochs {epochs_to_process}...")
+        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+            futures = [executor.submit(process_epoch, epoch) for epoch in epochs_to_process]
+            write_futures = []
+            
+            if not reuse_shared:
+                # Generate grant pools; the pool writes the file so the main thread can move on to projects
+                logger.info("Generating grant pools...")
+                grant_pools = converter.generate_grant_pools(epochs_to_process)
+                write_futures.append(executor.submit(write_json_file, grant_pools, f"{config.output_dir}/grant_pools.json", args.pretty))
+                
+                # Generate projects
+                logger.info("Generating projects...")
+                projects = converter.generate_projects(epochs_to_process)
+                write_futures.append(executor.submit(write_json_file, projects, f"{config.output_dir}/projects.json", args.pretty))
+            
+            for future in as_completed(futures):
+                logger.info(f"Wrote applications for epoch {future.result()}")
+            for future in write_futures:
+                future.result()
+        
+        if not reuse_shared:
+            write_json_file(
+                {
+                    "base_url": config.base_url,
+                    "current_epoch": current_epoch,
+                    "epochs": epochs_to_process,
+                    "pretty": args.pretty,
+                    "generated_at": converter.generated_at
+                },
+                f"{config.output_dir}/.state.json"
+            )
+        
+        # Generate enhanced summary with metadata, reusing the sync status loaded with the system info
+        indexed_epoch_info = converter.indexed_epoch_info
         
-        # Generate summary
         summary = {
-            "generated_at": datetime.now().isoformat() + "Z",
+            "conversion_completed_at": _utc_now_iso(),
             "epochs_processed": epochs_to_process,
+            "total_epochs_processed": len(epochs_to_process),
             "current_epoch": current_epoch,
+            "command_used": " ".join(sys.argv) if 'sys' in globals() else "python3 run.py",
             "files_generated": [
                 "grants_system.json",
-                "grant_pools.json",
+                "grant_pools.json", 
                 "projects.json"
-            ] + [f"applications_epoch_{epoch}.json" for epoch in epochs_to_process]
+            ] + [f"applications_epoch_{epoch}.json" for epoch in epochs_to_process],
+            "data_freshness": {
+                "api_endpoint": config.base_url,
+                "data_fetched_at": converter.generated_at,
+                "sync_status": indexed_epoch_info if indexed_epoch_info else "unavailable"
+            }
         }
         
-        with open(f"{config.output_dir}/generation_summary.json", "w") as f:
-            json.dump(summary, f, indent=2)
+        write_json_file(summary, f"{config.output_dir}/generation_summary.json", pretty=args.pretty)
         
         logger.info(f"Successfully generated DAOIP-5 files in {config.output_dir}/")
+        logger.info(f"Processed {len(epochs_to_process)} epochs: {epochs_to_process}")
         logger.info(f"Files: {summary['files_generated']}")
         
     except Exception as e:
@@ -900,4 +1184,5 @@ def main():
         raise
 
 if __name__ == "__main__":
+    import sys
     main()